@@ -1,64 +1,95 @@
 """Configuration for the Task MCP Server"""
 
+import json
 import os
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-
-from pydantic import Field
-from pydantic_settings import BaseSettings
+from typing import Any
 
 from dotenv import load_dotenv
-load_dotenv(Path(__file__).parent.parent / ".env")
 
-class Settings(BaseSettings):
+# only hand .env files to dotenv when they exist, deployments usually set
+# the environment directly
+_ENV_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), ".env")
+if os.path.isfile(_ENV_PATH):
+    load_dotenv(_ENV_PATH, override=False)
+if os.path.isfile(".env"):
+    load_dotenv(".env", encoding="utf-8", override=False)
+
+def _env(name: str) -> str | None:
+    """Read an environment variable case-insensitively, treating empty values as unset"""
+    lowered = name.lower()
+    for key, value in os.environ.items():
+        if key.lower() == lowered and value:
+            return value
+    return None
+
+@dataclass(frozen=True, slots=True)
+class Settings:
     """Settings for the Task MCP Server"""
 
     #Google Cloud Config
-    google_client_config: str = Field(
-        "credentials/client_secrets.json",
-        description="The path to store OAuth credentials",
-    )
+    # The path to the OAuth client config
+    google_client_config: str = "credentials/client_secrets.json"
 
-    google_token_file: str = Field(
-        ".gcp-saved-tokens.json",
-        description="The path to store OAuth credentials",
-    )
+    # The path to store OAuth credentials
+    google_token_file: str = ".gcp-saved-tokens.json"
 
-    google_oauth_port: int = Field(
-        8765,
-        description="The port to use for OAuth"
-    )
+    # The port to use for OAuth
+    google_oauth_port: int = 8765
 
     # Google Task API scopes
-    google_task_api_scopes: list[str] = Field(
-        ["https://www.googleapis.com/auth/tasks"],
-        description="The scopes to use for the Google Task API"
+    google_task_api_scopes: list[str] = field(
+        default_factory=lambda: ["https://www.googleapis.com/auth/tasks"]
     )
 
+    # Talk to the Tasks REST API directly instead of through googleapiclient
+    google_tasks_rest_client: bool = False
+
     # Logging Config
-    logging_level: str = Field(
-        "INFO",
-        description="The logging level to use for the server"
-    )
+    logging_level: str = "INFO"
+
+    _client_path: Path = field(init=False, repr=False, compare=False)
+    _token_path: Path = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Build the Path objects once"""
+        object.__setattr__(self, "_client_path", Path(self.google_client_config))
+        object.__setattr__(self, "_token_path", Path(self.google_token_file))
 
-    class Config:
-        """Config for the Settings"""
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
-        env_ignore_empty = True
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Load settings from the environment"""
+        # only pass the variables that are set, so unset ones keep the field defaults
+        kwargs: dict[str, Any] = {}
+        if (value := _env("GOOGLE_CLIENT_CONFIG")) is not None:
+            kwargs["google_client_config"] = value
+        if (value := _env("GOOGLE_TOKEN_FILE")) is not None:
+            kwargs["google_token_file"] = value
+        if (value := _env("GOOGLE_OAUTH_PORT")) is not None:
+            kwargs["google_oauth_port"] = int(value)
+        if (value := _env("GOOGLE_TASK_API_SCOPES")) is not None:
+            kwargs["google_task_api_scopes"] = json.loads(value)
+        if (value := _env("GOOGLE_TASKS_REST_CLIENT")) is not None:
+            kwargs["google_tasks_rest_client"] = value.lower() in ("1", "true", "yes")
+        if (value := _env("LOGGING_LEVEL")) is not None:
+            kwargs["logging_level"] = value
+        return cls(**kwargs)
 
-    def get_client_config_path(self) -> str:
+    def get_client_config_path(self) -> Path:
         """Get the client config path"""
-        return Path(self.google_client_config)
+        return self._client_path
 
-    def get_token_file_path(self) -> str:
+    def get_token_file_path(self) -> Path:
         """Get the token file path"""
-        return Path(self.google_token_file)
+        return self._token_path
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get application settings"""
     try:
-        return Settings()
+        return Settings.from_env()
     except Exception as e:
         raise ValueError(
             f"Configuration error: {e}. "
@@ -66,4 +97,4 @@ def get_settings() -> Settings:
             f"Current working directory: {os.getcwd()}. "
             f"GOOGLE_CLIENT_CONFIG: {os.getenv('GOOGLE_CLIENT_CONFIG')}, "
             f"GOOGLE_TOKEN_FILE: {os.getenv('GOOGLE_TOKEN_FILE')}"
-        ) from e
\ No newline at end of file
+        ) from e
@@ -1,14 +1,18 @@
 """MCP Server for Google Tasks"""
 
 import logging
+import re
+from functools import cache, lru_cache
 from typing import Annotated, Any
 from datetime import datetime, timedelta, timezone
 
 from mcp.server.fastmcp import FastMCP  # pyright: ignore[reportMissingImports]
 from pydantic import Field  # pyright: ignore[reportMissingImports]
+from pydantic_core import to_json  # pyright: ignore[reportMissingImports]
 
-from task_client import TaskClient
-from config import get_settings, Settings
+from task_client import BaseTaskClient, TaskClient
+from rest_task_client import RestTaskClient
+from config import get_settings
 
 def parse_task(task: dict[str, Any]) -> dict[str, Any]:
     # Only keep the useful fields in tasks
@@ -25,6 +29,20 @@ def parse_task(task: dict[str, Any]) -> dict[str, Any]:
         t["due"] = task["due"]
     return t
 
+_DUE_RE = re.compile(r"([0-9]{1,2})/([0-9]{1,2})/([0-9]{4})")
+_DUE_SUFFIX = "T00:00:00.000000Z"
+
+@lru_cache(maxsize=256)
+def parse_due_date(due_date: str) -> str:
+    # convert due_date from DD/MM/YYYY to RFC 3339 date string
+    m = _DUE_RE.fullmatch(due_date)
+    if not m:
+        raise ValueError(f"Invalid due date {due_date!r}, expected DD/MM/YYYY")
+    day, month, year = (int(g) for g in m.groups())
+    # validate the calendar date (e.g. reject 31/02)
+    datetime(year, month, day)
+    return f"{year:04d}-{month:02d}-{day:02d}{_DUE_SUFFIX}"
+
 def parse_tasklist(tasklist: dict[str, Any]) -> dict[str, Any]:
     # Only keep the useful fields in tasklists
     t = {
@@ -34,34 +52,38 @@ def parse_tasklist(tasklist: dict[str, Any]) -> dict[str, Any]:
 
     return t
 
+_IST = timezone(timedelta(hours=5, minutes=30))
+_DOW = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+# shared tool parameter descriptions
+TL_ID_FIELD = Field(description="The unique identifier of the task list")
+TL_TITLE_FIELD = Field(description="The title/name for the task list")
+TASK_ID_FIELD = Field(description="The unique identifier of the task")
+TASK_IDS_FIELD = Field(description="The unique identifiers of the tasks")
+
 logger = logging.getLogger(__name__)
 mcp = FastMCP("gtask-mcp-server")
 
-_task_client: TaskClient | None = None
-_settings: Settings | None = None
-
-def get_task_client() -> TaskClient:
+@cache
+def get_task_client() -> BaseTaskClient:
     """Get or initialize the task client"""
-    global _task_client, _settings
-    if _task_client is None:
-        if _settings is None:
-            _settings = get_settings()
-        _task_client = TaskClient.from_oauth_config(
-            client_config_path=str(_settings.get_client_config_path()),
-            token_file_path=str(_settings.get_token_file_path()),
-            oauth_port=_settings.google_oauth_port,
-            scopes=_settings.google_task_api_scopes,
-        )
-    return _task_client
+    settings = get_settings()
+    client_cls = RestTaskClient if settings.google_tasks_rest_client else TaskClient
+    return client_cls.from_oauth_config(
+        client_config_path=str(settings.get_client_config_path()),
+        token_file_path=str(settings.get_token_file_path()),
+        oauth_port=settings.google_oauth_port,
+        scopes=settings.google_task_api_scopes,
+    )
 
 @mcp.tool()
 def get_current_datetime():
     """Get the current date and time"""
     logger.debug("Getting current date and time")
-    t = datetime.now(timezone.utc).astimezone(timezone(timedelta(hours=5, minutes=30)))
+    t = datetime.now(_IST)
     return {
         #in iso format with day of the week
-        "local_time": t.isoformat() + " " + t.strftime("%A"),
+        "local_time": f"{t.isoformat()} {_DOW[t.weekday()]}",
     }
 
 @mcp.tool()
@@ -69,47 +91,47 @@ def list_tasklists():
     """Get all task lists"""
     logger.debug("Listing task lists")
     lists = get_task_client().tl_list()
-    logger.debug(f"Lists: {lists}")
-    return [parse_tasklist(tasklist) for tasklist in lists]
+    logger.debug("Lists: %s", lists)
+    return to_json([parse_tasklist(tasklist) for tasklist in lists]).decode()
 
 @mcp.tool()
-def add_tasklist(title: Annotated[str, Field(description="The title/name for the new task list")]):
+def add_tasklist(title: Annotated[str, TL_TITLE_FIELD]):
     """Add a new task list"""
-    logger.debug(f"Adding task list: {title}")
+    logger.debug("Adding task list: %s", title)
     ret = get_task_client().tl_add(title)
-    logger.debug(f"Task list added: {ret}")
+    logger.debug("Task list added: %s", ret)
     return parse_tasklist(ret)
 
 @mcp.tool()
-def delete_tasklist(tasklist_id: Annotated[str, Field(description="The unique identifier of the task list to delete")]):
+def delete_tasklist(tasklist_id: Annotated[str, TL_ID_FIELD]):
     """Delete a task list"""
-    logger.debug(f"Deleting task list: {tasklist_id}")
+    logger.debug("Deleting task list: %s", tasklist_id)
     ret = get_task_client().tl_delete(tasklist_id)
-    logger.debug(f"Task list deleted: {ret}")
+    logger.debug("Task list deleted: %s", ret)
     return ret
 
 @mcp.tool()
 def update_tasklist(
-    tasklist_id: Annotated[str, Field(description="The unique identifier of the task list to update")],
-    title: Annotated[str, Field(description="The new title/name for the task list")]
+    tasklist_id: Annotated[str, TL_ID_FIELD],
+    title: Annotated[str, TL_TITLE_FIELD]
 ):
     """Update a task list"""
-    logger.debug(f"Updating task list: {tasklist_id}")
+    logger.debug("Updating task list: %s", tasklist_id)
     ret = get_task_client().tl_update(tasklist_id, title)
-    logger.debug(f"Task list updated: {ret}")
+    logger.debug("Task list updated: %s", ret)
     return parse_tasklist(ret)
 
 @mcp.tool()
-def list_tasks(tasklist_id: Annotated[str, Field(description="The unique identifier of the task list to retrieve tasks from")]):
+def list_tasks(tasklist_id: Annotated[str, TL_ID_FIELD]):
     """List all tasks in a task list"""
-    logger.debug(f"Listing tasks: {tasklist_id}")
+    logger.debug("Listing tasks: %s", tasklist_id)
     tasks = get_task_client().task_list(tasklist_id)
-    logger.debug(f"Tasks: {tasks}")
-    return [parse_task(task) for task in tasks]
+    logger.debug("Tasks: %s", tasks)
+    return to_json([parse_task(task) for task in tasks]).decode()
 
 @mcp.tool()
 def add_task(
-    tasklist_id: Annotated[str, Field(description="The unique identifier of the task list to add the task to")],
+    tasklist_id: Annotated[str, TL_ID_FIELD],
     title: Annotated[str, Field(description="The title of the task")],
     description: Annotated[str | None, Field(description="The description/notes for the task (optional)")] = None,
     due_date: Annotated[str | None, Field(description="The due date in DD/MM/YYYY format (optional)")] = None
@@ -117,65 +139,86 @@ def add_task(
     """
     Add a new task to a task list
     """
-    logger.debug(f"Adding task: {title}")
+    logger.debug("Adding task: %s", title)
     due = None
     if due_date:
-        # convert due_date from DD/MM/YYYY to RFC 3339 date string
-        due = datetime.strptime(due_date, "%d/%m/%Y").strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+        due = parse_due_date(due_date)
     ret = get_task_client().task_add(tasklist_id, title, description, due)
-    logger.debug(f"Task added: {ret}")
+    logger.debug("Task added: %s", ret)
     return parse_task(ret)
 
 @mcp.tool()
 def delete_task(
-    tasklist_id: Annotated[str, Field(description="The unique identifier of the task list containing the task")],
-    task_id: Annotated[str, Field(description="The unique identifier of the task to delete")]
+    tasklist_id: Annotated[str, TL_ID_FIELD],
+    task_id: Annotated[str, TASK_ID_FIELD]
 ):
     """Delete a task from a task list"""
-    logger.debug(f"Deleting task: {task_id}")
+    logger.debug("Deleting task: %s", task_id)
     ret = get_task_client().task_delete(tasklist_id, task_id)
-    logger.debug(f"Task deleted: {ret}")
+    logger.debug("Task deleted: %s", ret)
     return ret
 
 @mcp.tool()
 def update_task(
-    tasklist_id: Annotated[str, Field(description="The unique identifier of the task list containing the task")],
-    task_id: Annotated[str, Field(description="The unique identifier of the task to update")],
+    tasklist_id: Annotated[str, TL_ID_FIELD],
+    task_id: Annotated[str, TASK_ID_FIELD],
     title: Annotated[str | None, Field(description="The new title for the task (optional, no change if not provided)")] = None,
     description: Annotated[str | None, Field(description="The new description/notes for the task (optional, no change if not provided)")] = None,
     due_date: Annotated[str | None, Field(description="The new due date in DD/MM/YYYY format (optional, no change if not provided)")] = None
 ):
     """Update a task in a task list"""
-    logger.debug(f"Updating task: {task_id}")
+    logger.debug("Updating task: %s", task_id)
     due = None
     if due_date:
-        # convert due_date from DD/MM/YYYY to RFC 3339 date string
-        due = datetime.strptime(due_date, "%d/%m/%Y").strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+        due = parse_due_date(due_date)
     ret = get_task_client().task_update(tasklist_id, task_id, title, description, due)
-    logger.debug(f"Task updated: {ret}")
+    logger.debug("Task updated: %s", ret)
     return parse_task(ret)
 
 @mcp.tool()
 def complete_task(
-    tasklist_id: Annotated[str, Field(description="The unique identifier of the task list containing the task")],
-    task_id: Annotated[str, Field(description="The unique identifier of the task to mark as completed")]
+    tasklist_id: Annotated[str, TL_ID_FIELD],
+    task_id: Annotated[str, TASK_ID_FIELD]
 ):
     """Complete a task in a task list"""
-    logger.debug(f"Completing task: {task_id}")
+    logger.debug("Completing task: %s", task_id)
     ret = get_task_client().task_complete(tasklist_id, task_id)
-    logger.debug(f"Task completed: {ret}")
+    logger.debug("Task completed: %s", ret)
     return parse_task(ret)
 
+@mcp.tool()
+def complete_tasks(
+    tasklist_id: Annotated[str, TL_ID_FIELD],
+    task_ids: Annotated[list[str], TASK_IDS_FIELD]
+):
+    """Complete several tasks in a task list at once, returning a result or error per task"""
+    logger.debug("Completing tasks: %s", task_ids)
+    ret = get_task_client().task_complete_many([(tasklist_id, task_id) for task_id in task_ids])
+    logger.debug("Tasks completed: %s", ret)
+    # failed items are already {"task_id", "error"} dicts
+    return [task if "error" in task else parse_task(task) for task in ret]
+
+@mcp.tool()
+def delete_tasks(
+    tasklist_id: Annotated[str, TL_ID_FIELD],
+    task_ids: Annotated[list[str], TASK_IDS_FIELD]
+):
+    """Delete several tasks from a task list at once, returning a result or error per task"""
+    logger.debug("Deleting tasks: %s", task_ids)
+    ret = get_task_client().task_delete_many([(tasklist_id, task_id) for task_id in task_ids])
+    logger.debug("Tasks deleted: %s", ret)
+    return ret
+
 @mcp.tool()
 def move_task(
     tasklist_id: Annotated[str, Field(description="The unique identifier of the current task list containing the task")],
-    task_id: Annotated[str, Field(description="The unique identifier of the task to move")],
+    task_id: Annotated[str, TASK_ID_FIELD],
     new_tasklist_id: Annotated[str, Field(description="The unique identifier of the destination task list")]
 ):
     """Move a task to a different task list"""
-    logger.debug(f"Moving task: {task_id} to {new_tasklist_id}")
+    logger.debug("Moving task: %s to %s", task_id, new_tasklist_id)
     ret = get_task_client().task_move(tasklist_id, task_id, new_tasklist_id)
-    logger.debug(f"Task moved: {ret}")
+    logger.debug("Task moved: %s", ret)
     return parse_task(ret)
 
 if __name__ == "__main__":
@@ -0,0 +1,108 @@
+from typing import Any
+from urllib.parse import quote
+
+import requests
+from google.auth.transport.requests import AuthorizedSession
+from google.oauth2.credentials import Credentials
+
+from task_client import TASK_LIST_FIELDS, BaseTaskClient
+
+_BASE_URL = "https://tasks.googleapis.com/tasks/v1"
+
+class RestTaskClient(BaseTaskClient):
+    """Client that calls the Tasks REST API directly over a requests session."""
+
+    __slots__ = ("_session",)
+
+    def __init__(self, credentials: Credentials):
+        super().__init__(credentials)
+        # refreshes the token when it is invalid and retries once on a 401
+        self._session = AuthorizedSession(credentials)
+
+    def _request(self, method: str, path: str, **kwargs: Any) -> Any:
+        resp = self._session.request(method, _BASE_URL + path, timeout=10, **kwargs)
+        resp.raise_for_status()
+        # deletes return an empty body, googleapiclient returns "" for those
+        return resp.json() if resp.content else ""
+
+    @staticmethod
+    def _tl_path(tasklist_id: str) -> str:
+        return f"/users/@me/lists/{quote(tasklist_id, safe='')}"
+
+    @staticmethod
+    def _tasks_path(tasklist_id: str, task_id: str | None = None) -> str:
+        path = f"/lists/{quote(tasklist_id, safe='')}/tasks"
+        if task_id is not None:
+            path += f"/{quote(task_id, safe='')}"
+        return path
+
+    def tl_list(self) -> list[dict[str, Any]]:
+        """List all task lists."""
+        return self._request("GET", "/users/@me/lists").get("items", [])
+
+    def tl_add(self, title: str) -> dict[str, Any]:
+        """Add a new task list."""
+        return self._request("POST", "/users/@me/lists", json={"title": title})
+
+    def tl_delete(self, tasklist_id: str) -> dict[str, Any]:
+        """Delete a task list."""
+        return self._request("DELETE", self._tl_path(tasklist_id))
+
+    def tl_update(self, tasklist_id: str, title: str) -> dict[str, Any]:
+        """Update a task list."""
+        return self._request("PATCH", self._tl_path(tasklist_id), json={"title": title})
+
+    def task_list(self, tasklist_id: str) -> list[dict[str, Any]]:
+        """List all tasks in a task list."""
+        params = {"maxResults": 100, "fields": TASK_LIST_FIELDS}
+        ret: list[dict[str, Any]] = []
+        while True:
+            response = self._request("GET", self._tasks_path(tasklist_id), params=params)
+            ret.extend(response.get("items", []))
+            if "nextPageToken" not in response:
+                return ret
+            params["pageToken"] = response["nextPageToken"]
+
+    def task_get(self, tasklist_id: str, task_id: str) -> dict[str, Any]:
+        """Get a single task from a task list."""
+        return self._request("GET", self._tasks_path(tasklist_id, task_id))
+
+    def task_add(self, tasklist_id: str, title: str, description: str | None = None, due: str | None = None) -> dict[str, Any]:
+        """Add a new task to a task list."""
+        body = {"title": title, "notes": description, "due": due}
+        return self._request("POST", self._tasks_path(tasklist_id), json=body)
+
+    def task_delete(self, tasklist_id: str, task_id: str) -> dict[str, Any]:
+        """Delete a task from a task list."""
+        return self._request("DELETE", self._tasks_path(tasklist_id, task_id))
+
+    def task_update(self, tasklist_id: str, task_id: str, title: str | None = None, description: str | None = None, due: str | None = None) -> dict[str, Any]:
+        """Update a task in a task list."""
+        body = self._update_body(title, description, due)
+        return self._request("PATCH", self._tasks_path(tasklist_id, task_id), json=body)
+
+    def task_complete(self, tasklist_id: str, task_id: str) -> dict[str, Any]:
+        """Complete a task in a task list."""
+        return self._request("PATCH", self._tasks_path(tasklist_id, task_id), json=self._completed_body())
+
+    def task_complete_many(self, pairs: list[tuple[str, str]]) -> list[dict[str, Any]]:
+        """Complete several tasks over the shared session, returning one result per task."""
+        body = self._completed_body()
+        ret: list[dict[str, Any]] = []
+        for tasklist_id, task_id in pairs:
+            try:
+                ret.append(self._request("PATCH", self._tasks_path(tasklist_id, task_id), json=body))
+            except requests.RequestException as e:
+                ret.append({"task_id": task_id, "error": str(e)})
+        return ret
+
+    def task_delete_many(self, pairs: list[tuple[str, str]]) -> list[dict[str, Any]]:
+        """Delete several tasks over the shared session, returning one result per task."""
+        ret: list[dict[str, Any]] = []
+        for tasklist_id, task_id in pairs:
+            try:
+                self.task_delete(tasklist_id, task_id)
+                ret.append({"task_id": task_id, "deleted": True})
+            except requests.RequestException as e:
+                ret.append({"task_id": task_id, "error": str(e)})
+        return ret
@@ -1,19 +1,22 @@
+from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any
-from datetime import datetime
+from typing import Any, Iterable, Self
+from datetime import datetime, timezone
+from itertools import batched
 
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
 
-class TaskClient:
-    """Client to interact with Google Tasks API."""
+# only request the task fields we use to keep list responses small
+TASK_LIST_FIELDS = "items(id,title,status,due,notes,completed),nextPageToken"
+
+class BaseTaskClient(ABC):
+    """Transport-independent parts shared by the Google Tasks clients."""
+
+    __slots__ = ("credentials",)
 
     def __init__(self, credentials: Credentials):
         self.credentials = credentials
-        self.service = build("tasks", "v1", credentials=credentials)
 
     @classmethod
     def from_oauth_config(
@@ -22,31 +25,143 @@ class TaskClient:
         token_file_path: str,
         oauth_port: int,
         scopes: list[str],
-    ) -> "TaskClient":
-        """Create a TaskClient from OAuth configuration."""
+    ) -> Self:
+        """Create a client from OAuth configuration."""
         credentials: Credentials | None = None
         token_file = Path(token_file_path)
 
         if token_file.exists():
             credentials = Credentials.from_authorized_user_file(token_file_path, scopes)
 
+        refreshed = False
         if not credentials or not credentials.valid:
             if credentials and credentials.expired and credentials.refresh_token:
                 credentials.refresh(Request())
             else:
+                from google_auth_oauthlib.flow import InstalledAppFlow
+
                 flow = InstalledAppFlow.from_client_secrets_file(client_config_path, scopes)
                 credentials = flow.run_local_server(port=oauth_port)
             
             if credentials is None:
                 raise RuntimeError("Failed to obtain OAuth credentials")
-            
-            with open(token_file_path, "w") as token:
-                token.write(credentials.to_json())
-        
+            refreshed = True
+
         if credentials is None:
             raise RuntimeError("Failed to obtain OAuth credentials after all attempts")
+
+        # only rewrite the token file when the credentials actually changed
+        if refreshed:
+            with open(token_file_path, "w") as token:
+                token.write(credentials.to_json())
+
         return cls(credentials)
 
+    @staticmethod
+    def _completed_body() -> dict[str, Any]:
+        return {
+            'status': 'completed',
+            # also set the completed field to a RFC 3339 date string
+            'completed': datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+        }
+
+    @staticmethod
+    def _update_body(title: str | None, description: str | None, due: str | None) -> dict[str, Any]:
+        # Only send the fields that were provided
+        body: dict[str, Any] = {}
+        if title is not None:
+            body['title'] = title
+        if description is not None:
+            body['notes'] = description
+        if due is not None:
+            body['due'] = due
+        return body
+
+    @abstractmethod
+    def tl_list(self) -> list[dict[str, Any]]:
+        """List all task lists."""
+
+    @abstractmethod
+    def tl_add(self, title: str) -> dict[str, Any]:
+        """Add a new task list."""
+
+    @abstractmethod
+    def tl_delete(self, tasklist_id: str) -> dict[str, Any]:
+        """Delete a task list."""
+
+    @abstractmethod
+    def tl_update(self, tasklist_id: str, title: str) -> dict[str, Any]:
+        """Update a task list."""
+
+    @abstractmethod
+    def task_list(self, tasklist_id: str) -> list[dict[str, Any]]:
+        """List all tasks in a task list."""
+
+    @abstractmethod
+    def task_get(self, tasklist_id: str, task_id: str) -> dict[str, Any]:
+        """Get a single task from a task list."""
+
+    @abstractmethod
+    def task_add(self, tasklist_id: str, title: str, description: str | None = None, due: str | None = None) -> dict[str, Any]:
+        """Add a new task to a task list."""
+
+    @abstractmethod
+    def task_delete(self, tasklist_id: str, task_id: str) -> dict[str, Any]:
+        """Delete a task from a task list."""
+
+    @abstractmethod
+    def task_update(self, tasklist_id: str, task_id: str, title: str | None = None, description: str | None = None, due: str | None = None) -> dict[str, Any]:
+        """Update a task in a task list."""
+
+    @abstractmethod
+    def task_complete(self, tasklist_id: str, task_id: str) -> dict[str, Any]:
+        """Complete a task in a task list."""
+
+    @abstractmethod
+    def task_complete_many(self, pairs: list[tuple[str, str]]) -> list[dict[str, Any]]:
+        """Complete several tasks, returning one result or error per task."""
+
+    @abstractmethod
+    def task_delete_many(self, pairs: list[tuple[str, str]]) -> list[dict[str, Any]]:
+        """Delete several tasks, returning one result or error per task."""
+
+    def task_move(self, tasklist_id: str, task_id: str, new_tasklist_id: str) -> dict[str, Any]:
+        """Move a task to a different task list."""
+        # First get the current task
+        current_task = self.task_get(tasklist_id, task_id)
+        # Create a copy in the new tasklist
+        notes = current_task['notes'] if 'notes' in current_task else None
+        due = current_task['due'] if 'due' in current_task else None
+        ret = self.task_add(new_tasklist_id, current_task['title'], notes, due)
+        # Delete the original task
+        self.task_delete(tasklist_id, task_id)
+        return ret
+
+class TaskClient(BaseTaskClient):
+    """Client to interact with Google Tasks API."""
+
+    __slots__ = ("service", "_http")
+
+    def __init__(self, credentials: Credentials):
+        # imported lazily, googleapiclient is slow to import
+        from google_auth_httplib2 import AuthorizedHttp
+        from googleapiclient.discovery import build
+        from googleapiclient.http import build_http
+
+        super().__init__(credentials)
+        # the one authorized http every request on this service goes through,
+        # built the same way build(credentials=...) would build it
+        self._http = AuthorizedHttp(credentials, http=build_http())
+        # use the discovery document bundled with googleapiclient, skipping
+        # the discovery cache lookup and any network fetch
+        self.service = build(
+            "tasks",
+            "v1",
+            http=self._http,
+            cache_discovery=False,
+            static_discovery=True,
+        )
+
     def tl_list(self) -> list[dict[str, Any]]:
         """List all task lists."""
         ret = self.service.tasklists().list().execute().get("items", [])
@@ -64,18 +179,25 @@ class TaskClient:
 
     def tl_update(self, tasklist_id: str, title: str) -> dict[str, Any]:
         """Update a task list."""
-        # First get the current tasklist
-        current_tasklist = self.service.tasklists().get(tasklist=tasklist_id).execute()
-        # Update the title
-        current_tasklist['title'] = title
-        # Update the tasklist with the full object
-        ret = self.service.tasklists().update(tasklist=tasklist_id, body=current_tasklist).execute()
+        ret = self.service.tasklists().patch(tasklist=tasklist_id, body={"title": title}).execute()
         return ret
 
     
     def task_list(self, tasklist_id: str) -> list[dict[str, Any]]:
         """List all tasks in a task list."""
-        ret = self.service.tasks().list(tasklist=tasklist_id).execute().get("items", [])
+        # follow nextPageToken so lists over one page are not truncated
+        tasks = self.service.tasks()
+        request = tasks.list(tasklist=tasklist_id, maxResults=100, fields=TASK_LIST_FIELDS)
+        ret: list[dict[str, Any]] = []
+        while request is not None:
+            response = request.execute()
+            ret.extend(response.get("items", []))
+            request = tasks.list_next(request, response)
+        return ret
+
+    def task_get(self, tasklist_id: str, task_id: str) -> dict[str, Any]:
+        """Get a single task from a task list."""
+        ret = self.service.tasks().get(tasklist=tasklist_id, task=task_id).execute()
         return ret
 
     def task_add(self, tasklist_id: str, title: str, description: str | None = None, due: str | None = None) -> dict[str, Any]:
@@ -90,36 +212,57 @@ class TaskClient:
 
     def task_update(self, tasklist_id: str, task_id: str, title: str | None = None, description: str | None = None, due: str | None = None) -> dict[str, Any]:
         """Update a task in a task list."""
-        # First get the current task
-        current_task = self.service.tasks().get(tasklist=tasklist_id, task=task_id).execute()
-        # Update the fields that were provided
-        if title is not None:
-            current_task['title'] = title
-        if description is not None:
-            current_task['notes'] = description
-        if due is not None:
-            current_task['due'] = due
-        # Update the task with the full object
-        ret = self.service.tasks().update(tasklist=tasklist_id, task=task_id, body=current_task).execute()
+        body = self._update_body(title, description, due)
+        ret = self.service.tasks().patch(tasklist=tasklist_id, task=task_id, body=body).execute()
         return ret
 
     def task_complete(self, tasklist_id: str, task_id: str) -> dict[str, Any]:
         """Complete a task in a task list."""
-        current_task = self.service.tasks().get(tasklist=tasklist_id, task=task_id).execute()
-        current_task['status'] = 'completed'
-        # also set the completed field to a RFC 3339 date string
-        current_task['completed'] = datetime.now().strftime("%Y-%m-%dT%H:%M:%S.%fZ")
-        ret = self.service.tasks().update(tasklist=tasklist_id, task=task_id, body=current_task).execute()
+        ret = self.service.tasks().patch(tasklist=tasklist_id, task=task_id, body=self._completed_body()).execute()
         return ret
 
-    def task_move(self, tasklist_id: str, task_id: str, new_tasklist_id: str) -> dict[str, Any]:
-        """Move a task to a different task list."""
-        # First get the current task
-        current_task = self.service.tasks().get(tasklist=tasklist_id, task=task_id).execute()
-        # Create a copy in the new tasklist
-        notes = current_task['notes'] if 'notes' in current_task else None
-        due = current_task['due'] if 'due' in current_task else None
-        ret = self.task_add(new_tasklist_id, current_task['title'], notes, due)
-        # Delete the original task
-        self.task_delete(tasklist_id, task_id)
-        return ret
\ No newline at end of file
+    def task_complete_many(self, pairs: list[tuple[str, str]]) -> list[dict[str, Any]]:
+        """Complete several tasks in batched requests, returning one result per task."""
+        body = self._completed_body()
+        responses = self._execute_batch(
+            self.service.tasks().patch(tasklist=tasklist_id, task=task_id, body=body)
+            for tasklist_id, task_id in pairs
+        )
+        return [
+            {"task_id": task_id, "error": str(exception)} if exception is not None else response
+            for (_, task_id), (response, exception) in zip(pairs, responses)
+        ]
+
+    def task_delete_many(self, pairs: list[tuple[str, str]]) -> list[dict[str, Any]]:
+        """Delete several tasks in batched requests, returning one result per task."""
+        responses = self._execute_batch(
+            self.service.tasks().delete(tasklist=tasklist_id, task=task_id)
+            for tasklist_id, task_id in pairs
+        )
+        return [
+            {"task_id": task_id, "error": str(exception)} if exception is not None else {"task_id": task_id, "deleted": True}
+            for (_, task_id), (_, exception) in zip(pairs, responses)
+        ]
+
+    def _execute_batch(self, requests: Iterable[Any]) -> list[tuple[Any, Exception | None]]:
+        """Send requests in as few HTTP round trips as possible.
+
+        Returns a (response, exception) pair per request, in order, so one
+        failing request does not hide the outcome of the others.
+        """
+        from googleapiclient.http import MAX_BATCH_LIMIT
+
+        results: list[tuple[Any, Exception | None]] = []
+        for chunk in batched(requests, MAX_BATCH_LIMIT):
+            chunk_results: list[tuple[Any, Exception | None]] = [(None, None)] * len(chunk)
+
+            def callback(request_id: str, response: Any, exception: Exception | None) -> None:
+                chunk_results[int(request_id)] = (response, exception)
+
+            batch = self.service.new_batch_http_request(callback=callback)
+            for i, request in enumerate(chunk):
+                batch.add(request, request_id=str(i))
+            batch.execute()
+            results.extend(chunk_results)
+        return results
+